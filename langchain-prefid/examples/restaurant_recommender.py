@@ -3,68 +3,133 @@ Example: Restaurant Recommender with PrefID
 Shows how to use PrefID tools with LangChain agents
 """
 
-from langchain_anthropic import ChatAnthropic
-from langchain.agents import create_tool_calling_agent, AgentExecutor
-from langchain_core.prompts import ChatPromptTemplate
-from langchain_prefid import create_prefid_tools
+import argparse
+import os
+from functools import lru_cache
+
+# Dispatch callbacks (tracing uploads etc.) off the request thread
+os.environ.setdefault("LANGCHAIN_CALLBACKS_BACKGROUND", "true")
 
 # Configuration
 CLIENT_ID = "your-client-id"
 ACCESS_TOKEN = "user-access-token"
 USER_ID = "user_123"
 
-# Create PrefID tools
-tools = create_prefid_tools(
-    client_id=CLIENT_ID,
-    access_token=ACCESS_TOKEN,
-    user_id=USER_ID
-)
+# Example interactions
+EXAMPLES = [
+    ("Restaurant Recommendation", "Recommend a restaurant for date night"),
+    ("Learn Preference", "I prefer when you give me just one clear recommendation instead of multiple options"),
+    ("Introspection", "Why did you respond that way?"),
+]
 
-# Initialize LLM
-llm = ChatAnthropic(model="claude-3-5-sonnet-20241022", temperature=0)
 
-# Create prompt
-system_prompt = """You are a helpful restaurant recommendation assistant.
+@lru_cache(maxsize=1)
+def get_llm():
+    """Build the ChatAnthropic client once per process.
 
-IMPORTANT: Before making recommendations:
-1. Call get_thinking_preferences to understand HOW the user wants responses
-2. Call get_user_preferences with 'food_profile' to understand WHAT they like
-3. Structure your response according to their thinking preferences
+    One client means one underlying httpx connection pool, so every agent
+    turn reuses the same keep-alive TLS connection instead of paying a
+    fresh handshake. Prompt caching lets Claude reuse the system-prompt
+    prefix across agent turns instead of re-prefilling it each call.
+    """
+    from langchain_anthropic import ChatAnthropic
 
-If the user asks why you're responding a certain way, use explain_response_style.
-If the user tells you how they prefer responses, use learn_thinking_preference.
-"""
+    return ChatAnthropic(
+        model="claude-3-5-sonnet-20241022",
+        temperature=0,
+        default_headers={"anthropic-beta": "prompt-caching-2024-07-31"},
+    )
 
-prompt = ChatPromptTemplate.from_messages([
-    ("system", system_prompt),
-    ("placeholder", "{chat_history}"),
-    ("human", "{input}"),
-    ("placeholder", "{agent_scratchpad}"),
-])
 
-# Create agent
-agent = create_tool_calling_agent(llm, tools, prompt)
-executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
+def build_cache_monitor():
+    """Build a callback that prints Anthropic prompt-cache usage per LLM call.
+
+    Use it (PREFID_CACHE_METRICS=1) to verify the prompt-caching setup above
+    is actually engaging: after the first call the hit ratio should be high.
+    """
+    from langchain_core.callbacks import BaseCallbackHandler
+
+    class PrefixCacheMonitor(BaseCallbackHandler):
+        def on_llm_end(self, response, **kwargs):
+            # Streamed calls aggregate the result from chunks and leave
+            # llm_output empty, so read the message's usage_metadata first
+            # and fall back to llm_output for non-streamed calls
+            generation = response.generations[0][0] if response.generations and response.generations[0] else None
+            metadata = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if metadata:
+                details = metadata.get("input_token_details") or {}
+                read = details.get("cache_read", 0)
+                created = details.get("cache_creation", 0)
+                # input_tokens counts the cached tokens too
+                fresh = max(metadata.get("input_tokens", 0) - read - created, 0)
+            else:
+                usage = (response.llm_output or {}).get("usage") or {}
+                read = usage.get("cache_read_input_tokens", 0)
+                created = usage.get("cache_creation_input_tokens", 0)
+                fresh = usage.get("input_tokens", 0)
+            total = read + created + fresh
+            if total:
+                print(
+                    f"\n[cache] read={read} created={created} input={fresh} "
+                    f"hit_ratio={read / total:.0%}"
+                )
+
+    return PrefixCacheMonitor()
+
+
+def main():
+    # LangChain imports live here so `--help` (and importing this module)
+    # skip the ~1-2s of pydantic model registration they trigger
+    from langchain.agents import create_tool_calling_agent, AgentExecutor
+    from langchain_prefid import create_prefid_tools
+    from langchain_prefid.prompts import restaurant_prompt
+
+    # Create PrefID tools
+    tools = create_prefid_tools(
+        client_id=CLIENT_ID,
+        access_token=ACCESS_TOKEN,
+        user_id=USER_ID
+    )
+
+    # Initialize LLM
+    llm = get_llm()
+
+    # Create agent (prompt is shared with scripts/push_to_hub.py)
+    prompt = restaurant_prompt()
+    agent = create_tool_calling_agent(llm, tools, prompt)
+    # Set PREFID_VERBOSE=1 to see the agent's intermediate steps; the default
+    # keeps synchronous trace printing off the hot path
+    executor = AgentExecutor(
+        agent=agent,
+        tools=tools,
+        verbose=os.getenv("PREFID_VERBOSE", "0") == "1",
+    )
+
+    # Set PREFID_CACHE_METRICS=1 to print per-call prompt-cache hit ratios.
+    # Passed per request rather than to the AgentExecutor constructor:
+    # constructor callbacks stay scoped to the executor's own run and never
+    # see the nested LLM runs that carry the usage data
+    callbacks = []
+    if os.getenv("PREFID_CACHE_METRICS", "0") == "1":
+        callbacks.append(build_cache_monitor())
+
+    # AgentExecutor.stream yields step-level chunks: tool calls surface as
+    # they happen instead of the run being silent until the end, but the
+    # final answer still arrives as one "output" chunk after the last LLM
+    # call (use astream_events for token-level streaming)
+    for i, (title, question) in enumerate(EXAMPLES, start=1):
+        print(f"=== Example {i}: {title} ===")
+        for chunk in executor.stream({"input": question}, config={"callbacks": callbacks}):
+            if "actions" in chunk:
+                for action in chunk["actions"]:
+                    print(f"[step] calling {action.tool}", flush=True)
+            elif "output" in chunk:
+                print(f"\nResponse: {chunk['output']}\n")
+
 
-# Example interactions
 if __name__ == "__main__":
-    # Example 1: Get recommendation
-    print("=== Example 1: Restaurant Recommendation ===")
-    result = executor.invoke({
-        "input": "Recommend a restaurant for date night"
-    })
-    print(f"\nResponse: {result['output']}\n")
-    
-    # Example 2: Learn preference
-    print("=== Example 2: Learn Preference ===")
-    result = executor.invoke({
-        "input": "I prefer when you give me just one clear recommendation instead of multiple options"
-    })
-    print(f"\nResponse: {result['output']}\n")
-    
-    # Example 3: Ask why
-    print("=== Example 3: Introspection ===")
-    result = executor.invoke({
-        "input": "Why did you respond that way?"
-    })
-    print(f"\nResponse: {result['output']}\n")
+    # Parse args before any langchain import so `--help` returns instantly
+    argparse.ArgumentParser(
+        description="Run the PrefID restaurant recommender examples"
+    ).parse_args()
+    main()
@@ -10,6 +10,13 @@ from .tools import (
     PrefIDThinkingTool,
     PrefIDLearnTool,
     PrefIDWhyTool,
+    create_prefid_tools,
+)
+from .prompts import (
+    SYSTEM_PROMPT_RESTAURANT,
+    SYSTEM_PROMPT_BASIC,
+    restaurant_prompt,
+    basic_prompt,
 )
 
 __all__ = [
@@ -17,4 +24,9 @@ __all__ = [
     "PrefIDThinkingTool",
     "PrefIDLearnTool",
     "PrefIDWhyTool",
+    "create_prefid_tools",
+    "SYSTEM_PROMPT_RESTAURANT",
+    "SYSTEM_PROMPT_BASIC",
+    "restaurant_prompt",
+    "basic_prompt",
 ]
@@ -0,0 +1,69 @@
+"""
+Shared prompts for PrefID agents
+Single source of truth so scripts, examples, and docs stay in sync
+"""
+
+from functools import lru_cache
+
+from langchain_core.prompts import ChatPromptTemplate
+
+# Stable role description + tool contract. Keep this block frozen: the
+# Anthropic prefix cache only reuses the contiguous leading block up to the
+# first differing token, so edits here invalidate the cache for every call.
+SYSTEM_PROMPT_RESTAURANT_STATIC = """You are a helpful restaurant recommendation assistant.
+
+IMPORTANT: Before making recommendations:
+1. Call get_thinking_preferences to understand HOW the user wants responses
+2. Call get_user_preferences with 'food_profile' to understand WHAT they like
+3. Structure your response according to their thinking preferences
+"""
+
+# Deployment-specific guidance. Safe to edit per app: it sits after the
+# cached prefix, so changes here don't evict the static block above.
+SYSTEM_PROMPT_RESTAURANT_DYNAMIC = """
+If the user asks why you're responding a certain way, use explain_response_style.
+If the user tells you how they prefer responses, use learn_thinking_preference.
+"""
+
+SYSTEM_PROMPT_RESTAURANT = SYSTEM_PROMPT_RESTAURANT_STATIC + SYSTEM_PROMPT_RESTAURANT_DYNAMIC
+
+SYSTEM_PROMPT_BASIC = """You are a helpful assistant with access to user preferences.
+Use the provided tools to personalize your responses based on user preferences.
+"""
+
+
+@lru_cache(maxsize=None)
+def restaurant_prompt() -> ChatPromptTemplate:
+    """Build the restaurant recommender prompt (cached per process).
+
+    The static system block carries Anthropic's ``cache_control`` marker so
+    the prompt prefix is KV-cached server-side and reused across agent turns;
+    the deployment-specific block follows it uncached.
+    """
+    return ChatPromptTemplate.from_messages([
+        ("system", [
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT_RESTAURANT_STATIC,
+                "cache_control": {"type": "ephemeral"},
+            },
+            {
+                "type": "text",
+                "text": SYSTEM_PROMPT_RESTAURANT_DYNAMIC,
+            },
+        ]),
+        ("placeholder", "{chat_history}"),
+        ("human", "{input}"),
+        ("placeholder", "{agent_scratchpad}"),
+    ])
+
+
+@lru_cache(maxsize=None)
+def basic_prompt() -> ChatPromptTemplate:
+    """Build the basic agent prompt (cached per process)."""
+    return ChatPromptTemplate.from_messages([
+        ("system", SYSTEM_PROMPT_BASIC),
+        ("placeholder", "{chat_history}"),
+        ("human", "{input}"),
+        ("placeholder", "{agent_scratchpad}"),
+    ])
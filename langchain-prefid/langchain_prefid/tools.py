@@ -3,6 +3,7 @@ PrefID Tools for LangChain
 Official LangChain integration for preference-aware AI agents
 """
 
+from functools import lru_cache
 from typing import Optional, Type
 from pydantic import BaseModel, Field
 from langchain_core.tools import BaseTool
@@ -179,6 +180,25 @@ class PrefIDWhyTool(BaseTool):
             return f"Error getting explanation: {str(e)}"
 
 
+# Cached per (client_id, access_token, user_id) so repeated calls reuse the
+# same PrefID client and already-built pydantic tool schemas. Returns a tuple
+# so the cached value stays immutable across callers.
+@lru_cache(maxsize=32)
+def _cached_prefid_tools(
+    client_id: str,
+    access_token: str,
+    user_id: str,
+) -> tuple[BaseTool, ...]:
+    prefid = PrefID(client_id=client_id, access_token=access_token)
+
+    return (
+        PrefIDPreferenceTool(prefid_client=prefid),
+        PrefIDThinkingTool(prefid_client=prefid),
+        PrefIDLearnTool(prefid_client=prefid),
+        PrefIDWhyTool(prefid_client=prefid),
+    )
+
+
 # Helper function to create all tools at once
 def create_prefid_tools(
     client_id: str,
@@ -187,15 +207,18 @@ def create_prefid_tools(
 ) -> list[BaseTool]:
     """
     Create all PrefID tools for LangChain agents.
-    
+
+    Tool construction is cached per credential set, so calling this
+    repeatedly in one process returns the same tool instances.
+
     Args:
         client_id: PrefID client ID
         access_token: User's access token
         user_id: User ID for thinking preferences
-        
+
     Returns:
         List of configured PrefID tools
-        
+
     Example:
         >>> from langchain_prefid import create_prefid_tools
         >>> tools = create_prefid_tools(
@@ -205,11 +228,4 @@ def create_prefid_tools(
         >>> )
         >>> # Use with LangChain agent
     """
-    prefid = PrefID(client_id=client_id, access_token=access_token)
-    
-    return [
-        PrefIDPreferenceTool(prefid_client=prefid),
-        PrefIDThinkingTool(prefid_client=prefid),
-        PrefIDLearnTool(prefid_client=prefid),
-        PrefIDWhyTool(prefid_client=prefid),
-    ]
+    return list(_cached_prefid_tools(client_id, access_token, user_id))
@@ -1,137 +1,117 @@
+"""
+Generate docs/prefid.ipynb from the canonical prompts.
+
+Usage:
+    pip install -e .  # the system prompt is imported from langchain_prefid
+    python3 scripts/generate_docs.py
+"""
+
+import hashlib
 import json
-import os
+from pathlib import Path
 
-cells = [
-    {
-        "cell_type": "markdown",
-        "metadata": {},
-        "source": [
-            "# PrefID Integration\n",
-            "\n",
-            "[PrefID](https://pref-id.vercel.app) provides identity-aware memory infrastructure for AI agents.\n",
-            "It helps agents understand:\n",
-            "- **WHAT** users like (content preferences)\n",
-            "- **HOW** users want responses (thinking preferences / Atom of Thought)\n",
-            "\n",
-            "This integration allows LangChain agents to access and learn user preferences using standardized tools."
-        ]
-    },
-    {
-        "cell_type": "markdown",
-        "metadata": {},
-        "source": [
-            "## Installation"
-        ]
-    },
-    {
-        "cell_type": "code",
-        "execution_count": None,
-        "metadata": {},
-        "outputs": [],
-        "source": [
-            "%pip install -U langchain-prefid langchain-anthropic"
-        ]
-    },
-    {
-        "cell_type": "markdown",
-        "metadata": {},
-        "source": [
-            "## Setup\n",
-            "\n",
-            "Get your Client ID from the [PrefID Dashboard](https://pref-id.vercel.app/dashboard)."
-        ]
-    },
-    {
-        "cell_type": "code",
-        "execution_count": None,
-        "metadata": {},
-        "outputs": [],
-        "source": [
-            "import os\n",
-            "from langchain_prefid import create_prefid_tools\n",
-            "from langchain_anthropic import ChatAnthropic\n",
-            "from langchain.agents import create_tool_calling_agent, AgentExecutor\n",
-            "from langchain_core.prompts import ChatPromptTemplate\n",
-            "\n",
-            "# Configuration\n",
-            "# In production, use environment variables or OAuth flow\n",
-            "CLIENT_ID = \"your-client-id\"\n",
-            "ACCESS_TOKEN = \"user-access-token\" \n",
-            "USER_ID = \"user_123\"\n",
-            "\n",
-            "# Initialize LLM\n",
-            "llm = ChatAnthropic(model=\"claude-3-5-sonnet-20241022\", temperature=0)"
-        ]
-    },
-    {
-        "cell_type": "markdown",
-        "metadata": {},
-        "source": [
-            "## Create Tools\n",
-            "\n",
-            "The `create_prefid_tools` helper creates a suite of tools for reading/writing preferences and introspection."
-        ]
-    },
-    {
-        "cell_type": "code",
-        "execution_count": None,
-        "metadata": {},
-        "outputs": [],
-        "source": [
-            "tools = create_prefid_tools(\n",
-            "    client_id=CLIENT_ID,\n",
-            "    access_token=ACCESS_TOKEN,\n",
-            "    user_id=USER_ID\n",
-            ")\n",
-            "\n",
-            "# View available tools\n",
-            "for tool in tools:\n",
-            "    print(f\"- {tool.name}: {tool.description}\")"
-        ]
-    },
-    {
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from langchain_prefid.prompts import SYSTEM_PROMPT_RESTAURANT
+
+# Resolved once; no repeated '..' resolution on each use
+OUTPUT_PATH = Path(__file__).resolve().parent.parent / 'docs' / 'prefid.ipynb'
+
+# Embed the canonical system prompt into the notebook at generation time so
+# the docs stay byte-identical with the example and push_to_hub scripts
+# (drift here silently breaks cross-consumer prompt caching)
+_prompt_literal = 'system_prompt = """' + SYSTEM_PROMPT_RESTAURANT + '"""\n'
+
+
+def md(source):
+    """Build a markdown cell. nbformat accepts a plain string as source."""
+    return {
         "cell_type": "markdown",
         "metadata": {},
-        "source": [
-            "## Create and Run Agent\n",
-            "\n",
-            "We'll create an agent that recommends restaurants based on BOTH content preferences (food) AND thinking preferences (verbosity/style)."
-        ]
-    },
-    {
+        "source": source,
+    }
+
+
+def code(source):
+    """Build a code cell. nbformat accepts a plain string as source."""
+    return {
         "cell_type": "code",
         "execution_count": None,
         "metadata": {},
         "outputs": [],
-        "source": [
-            "system_prompt = \"\"\"You are a helpful assistant.\n",
-            "\n",
-            "IMPORTANT: Before making recommendations:\n",
-            "1. Call get_thinking_preferences to understand HOW the user wants responses (AoT)\n",
-            "2. Call get_user_preferences with 'food_profile' to understand WHAT they like\n",
-            "3. Structure your response according to their thinking preferences\n",
-            "\n",
-            "If the user asks why you're responding a certain way, use explain_response_style.\n",
-            "\"\"\"\n",
-            "\n",
-            "prompt = ChatPromptTemplate.from_messages([\n",
-            "    (\"system\", system_prompt),\n",
-            "    (\"placeholder\", \"{chat_history}\"),\n",
-            "    (\"human\", \"{input}\"),\n",
-            "    (\"placeholder\", \"{agent_scratchpad}\"),\n",
-            "])\n",
-            "\n",
-            "agent = create_tool_calling_agent(llm, tools, prompt)\n",
-            "executor = AgentExecutor(agent=agent, tools=tools, verbose=True)\n",
-            "\n",
-            "# Run the agent\n",
-            "result = executor.invoke({\n",
-            "    \"input\": \"Recommend a restaurant for date night\"\n",
-            "})\n",
-            "\n",
-            "print(result['output'])"
-        ]
+        "source": source,
     }
+
+
+cells = [
+    md("""\
+# PrefID Integration
+
+[PrefID](https://pref-id.vercel.app) provides identity-aware memory infrastructure for AI agents.
+It helps agents understand:
+- **WHAT** users like (content preferences)
+- **HOW** users want responses (thinking preferences / Atom of Thought)
+
+This integration allows LangChain agents to access and learn user preferences using standardized tools."""),
+    md("## Installation"),
+    code("%pip install -U langchain-prefid langchain-anthropic"),
+    md("""\
+## Setup
+
+Get your Client ID from the [PrefID Dashboard](https://pref-id.vercel.app/dashboard)."""),
+    code("""\
+import os
+from langchain_prefid import create_prefid_tools
+from langchain_anthropic import ChatAnthropic
+from langchain.agents import create_tool_calling_agent, AgentExecutor
+from langchain_core.prompts import ChatPromptTemplate
+
+# Configuration
+# In production, use environment variables or OAuth flow
+CLIENT_ID = "your-client-id"
+ACCESS_TOKEN = "user-access-token"
+USER_ID = "user_123"
+
+# Initialize LLM
+llm = ChatAnthropic(model="claude-3-5-sonnet-20241022", temperature=0)"""),
+    md("""\
+## Create Tools
+
+The `create_prefid_tools` helper creates a suite of tools for reading/writing preferences and introspection."""),
+    code("""\
+tools = create_prefid_tools(
+    client_id=CLIENT_ID,
+    access_token=ACCESS_TOKEN,
+    user_id=USER_ID
+)
+
+# View available tools
+for tool in tools:
+    print(f"- {tool.name}: {tool.description}")"""),
+    md("""\
+## Create and Run Agent
+
+We'll create an agent that recommends restaurants based on BOTH content preferences (food) AND thinking preferences (verbosity/style)."""),
+    code(_prompt_literal + """
+prompt = ChatPromptTemplate.from_messages([
+    ("system", system_prompt),
+    ("placeholder", "{chat_history}"),
+    ("human", "{input}"),
+    ("placeholder", "{agent_scratchpad}"),
+])
+
+agent = create_tool_calling_agent(llm, tools, prompt)
+executor = AgentExecutor(agent=agent, tools=tools, verbose=True)
+
+# Run the agent
+result = executor.invoke({
+    "input": "Recommend a restaurant for date night"
+})
+
+print(result['output'])"""),
 ]
 
 nb = {
@@ -159,10 +139,26 @@ nb = {
     "nbformat_minor": 5
 }
 
-output_path = os.path.join(os.path.dirname(__file__), '../docs/prefid.ipynb')
-print(f"Generating notebook at: {output_path}")
+print(f"Generating notebook at: {OUTPUT_PATH}")
+
+# Encode once and write bytes in one go, rather than streaming the encoder
+# through a text-mode codec layer; orjson's encoder is several times faster
+# than stdlib json when it's installed
+if orjson is not None:
+    data = orjson.dumps(nb, option=orjson.OPT_INDENT_2)
+else:
+    data = json.dumps(nb, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Skip the write when the on-disk notebook already matches, so mtime-based
+# doc builds and file watchers don't rebuild on every invocation
+try:
+    old_digest = hashlib.blake2b(OUTPUT_PATH.read_bytes()).digest()
+except FileNotFoundError:
+    old_digest = None
 
-with open(output_path, 'w') as f:
-    json.dump(nb, f, indent=2)
-    
-print("Success!")
+if old_digest == hashlib.blake2b(data).digest():
+    print("Notebook is up-to-date, skipping write")
+else:
+    OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT_PATH.write_bytes(data)
+    print("Success!")
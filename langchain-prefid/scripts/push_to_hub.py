@@ -4,57 +4,77 @@ Script to push PrefID agent prompts to LangSmith Hub.
 Usage:
     export LANGCHAIN_API_KEY="..."
     pip install langchainhub
-    python3 scripts/push_to_hub.py
+    pip install -e .  # the prompts are imported from langchain_prefid
+    python3 scripts/push_to_hub.py [--handle YOUR_HANDLE]
 """
 
+import argparse
+import asyncio
+import os
+
 from langchain import hub
 # from langchainhub import Client # Not needed
-from langchain_core.prompts import ChatPromptTemplate
-
-# Configuration
-# Replace 'talentxmdu' with your LangSmith handle if different
-HANDLE = "talentxmdu" 
-
-# 1. Restaurant Recommender Prompt
-restaurant_prompt = ChatPromptTemplate.from_messages([
-    ("system", """You are a helpful restaurant recommendation assistant.
-
-IMPORTANT: Before making recommendations:
-1. Call get_thinking_preferences to understand HOW the user wants responses
-2. Call get_user_preferences with 'food_profile' to understand WHAT they like
-3. Structure your response according to their thinking preferences
-
-If the user asks why you're responding a certain way, use explain_response_style.
-If the user tells you how they prefer responses, use learn_thinking_preference.
-"""),
-    ("placeholder", "{chat_history}"),
-    ("human", "{input}"),
-    ("placeholder", "{agent_scratchpad}"),
-])
-
-# 2. Basic Agent Prompt
-basic_prompt = ChatPromptTemplate.from_messages([
-    ("system", """You are a helpful assistant with access to user preferences.
-Use the provided tools to personalize your responses based on user preferences.
-"""),
-    ("placeholder", "{chat_history}"),
-    ("human", "{input}"),
-    ("placeholder", "{agent_scratchpad}"),
-])
+from langchain_prefid.prompts import restaurant_prompt, basic_prompt
+
+
+async def push_all(prompts):
+    """Push every (name, template) pair concurrently; return True on success.
+
+    Uses the hub's async client when one exists, otherwise runs the sync
+    push in worker threads so the uploads still overlap.
+    """
+    apush = getattr(hub, "apush", None)
+
+    async def push_one(name, template):
+        try:
+            if apush is not None:
+                await apush(name, template)
+            else:
+                await asyncio.to_thread(hub.push, name, template)
+            print(f"✅ Pushed: {name}")
+            return True
+        except Exception as e:
+            print(f"❌ Failed: {name}: {e}")
+            return False
+
+    results = await asyncio.gather(
+        *(push_one(name, template) for name, template in prompts)
+    )
+    return all(results)
+
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Push PrefID prompts to LangSmith Hub")
+    parser.add_argument(
+        "--handle",
+        default=os.getenv("LANGSMITH_HANDLE", "talentxmdu"),
+        help="LangSmith handle to push under (default: $LANGSMITH_HANDLE or 'talentxmdu')",
+    )
+    args = parser.parse_args()
+    handle = args.handle
+
+    prompts = [
+        (f"{handle}/restaurant-recommender", restaurant_prompt()),
+        (f"{handle}/basic-agent", basic_prompt()),
+    ]
+
     print("Pushing prompts to LangSmith Hub...")
-    try:
-        # Push to your handle (requires login)
-        # Change 'talentxmdu' to your handle if different, or just 'prefid-sdk'
-        
-        hub.push(f"{HANDLE}/restaurant-recommender", restaurant_prompt)
-        print(f"✅ Pushed: {HANDLE}/restaurant-recommender")
-        
-        hub.push(f"{HANDLE}/basic-agent", basic_prompt)
-        print(f"✅ Pushed: {HANDLE}/basic-agent")
-        
-        print(f"\nSuccess! View at https://smith.langchain.com/hub/{HANDLE}")
-    except Exception as e:
-        print(f"\nError pushing to hub: {e}")
-        print("Did you login? Run: langchain hub login")
+    # Push to your handle (requires login)
+    push_many = getattr(hub, "push_many", None)
+    if push_many is not None:
+        # Bulk endpoint: one request for all prompts
+        try:
+            push_many(dict(prompts))
+            for name, _ in prompts:
+                print(f"✅ Pushed: {name}")
+            ok = True
+        except Exception as e:
+            print(f"❌ Failed: {e}")
+            ok = False
+    else:
+        ok = asyncio.run(push_all(prompts))
+
+    if ok:
+        print(f"\nSuccess! View at https://smith.langchain.com/hub/{handle}")
+    else:
+        print("\nDid you login? Run: langchain hub login")